@@ -5,51 +5,307 @@ Embeds subtitle files as selectable tracks (not hardcoded/burned)
 """
 
 import argparse
+import functools
+import hashlib
+import json
+import re
+import shutil
 import subprocess
 import sys
 import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+@functools.cache
+def _probe_ffmpeg() -> str:
+    """Locate FFmpeg and verify it runs; cached so the probe happens once"""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        print("ERROR: FFmpeg is not installed or not in PATH")
+        print("Please install FFmpeg: https://ffmpeg.org/download.html")
+        sys.exit(1)
+    try:
+        subprocess.run([ffmpeg, '-version'],
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL,
+                     check=True)
+    except (subprocess.CalledProcessError, OSError):
+        print("ERROR: FFmpeg is not installed or not in PATH")
+        print("Please install FFmpeg: https://ffmpeg.org/download.html")
+        sys.exit(1)
+    return ffmpeg
+
+@functools.lru_cache(maxsize=128)
+def _probe_streams(path: str, mtime: float, size: int):
+    """ffprobe stream info for a file, cached per (path, mtime, size)
+
+    mtime and size are part of the key so edits to the file invalidate
+    the cached entry. Returns [] when ffprobe is unavailable or fails.
+    """
+    ffprobe = shutil.which('ffprobe')
+    if ffprobe is None:
+        return []
+    try:
+        result = subprocess.run([ffprobe, '-v', 'error',
+                                 '-show_streams', '-of', 'json', path],
+                              stdin=subprocess.DEVNULL,
+                              capture_output=True,
+                              check=True)
+        return json.loads(result.stdout).get('streams', [])
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        return []
 
 class SubtitleEmbedder:
     """Handle soft-embedding of subtitles into video files using FFmpeg"""
     
     SUPPORTED_VIDEO_FORMATS = {'.mp4', '.mkv', '.avi', '.mov', '.m4v'}
     SUPPORTED_SUBTITLE_FORMATS = {'.srt', '.ass', '.ssa', '.vtt'}
+
+    # Subtitle codec per container (mov_text for MP4-family, copy elsewhere)
+    _SUBTITLE_CODEC_BY_CONTAINER = {
+        '.mp4': 'mov_text',
+        '.m4v': 'mov_text',
+        '.mov': 'mov_text',
+        '.mkv': 'copy',
+        '.avi': 'copy',
+    }
+
+    # Demuxer per subtitle extension, passed as -f before each -i so FFmpeg
+    # skips format probing (seek + avformat_find_stream_info) per input
+    _SUBTITLE_DEMUXER_BY_SUFFIX = {
+        '.srt': 'srt',
+        '.ass': 'ass',
+        '.ssa': 'ass',
+        '.vtt': 'webvtt',
+    }
     
-    def __init__(self):
-        self.check_ffmpeg()
-    
-    def check_ffmpeg(self) -> bool:
-        """Check if FFmpeg is installed and accessible"""
-        try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         stdout=subprocess.DEVNULL, 
-                         stderr=subprocess.DEVNULL, 
-                         check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("ERROR: FFmpeg is not installed or not in PATH")
-            print("Please install FFmpeg: https://ffmpeg.org/download.html")
-            sys.exit(1)
+    def __init__(self, threads: int = 0, fast_mux: bool = False):
+        self.ffmpeg = self.check_ffmpeg()
+        self.threads = threads
+        self.fast_mux = fast_mux
+
+    def check_ffmpeg(self) -> str:
+        """Check if FFmpeg is installed and return its resolved path"""
+        return _probe_ffmpeg()
     
-    def validate_file(self, filepath: str, file_type: str) -> Path:
-        """Validate file exists and has correct extension"""
+    @staticmethod
+    def _suffix(path: str) -> str:
+        """Lowercased extension of a path string, without a Path object"""
+        i = path.rfind('.')
+        return path[i:].lower() if i != -1 else ''
+
+    def validate_file(self, filepath: str, file_type: str) -> Tuple[Path, str]:
+        """Validate file exists and has correct extension
+
+        Returns both the Path and the plain str so callers can keep the str
+        for argv building without re-allocating PurePath objects.
+        """
         path = Path(filepath)
-        
+
         if not path.exists():
             raise FileNotFoundError(f"{file_type} file not found: {filepath}")
-        
+
+        suffix = self._suffix(filepath)
         if file_type == "video":
-            if path.suffix.lower() not in self.SUPPORTED_VIDEO_FORMATS:
-                raise ValueError(f"Unsupported video format: {path.suffix}")
+            if suffix not in self.SUPPORTED_VIDEO_FORMATS:
+                raise ValueError(f"Unsupported video format: {suffix}")
         elif file_type == "subtitle":
-            if path.suffix.lower() not in self.SUPPORTED_SUBTITLE_FORMATS:
-                raise ValueError(f"Unsupported subtitle format: {path.suffix}")
-        
-        return path
+            if suffix not in self.SUPPORTED_SUBTITLE_FORMATS:
+                raise ValueError(f"Unsupported subtitle format: {suffix}")
+
+        return path, os.fspath(filepath)
     
-    def embed_subtitles(self, 
+    def _build_cmd(self,
+                   video: Path,
+                   video_str: str,
+                   subtitle_tracks: List[Dict[str, str]],
+                   output_path: Path,
+                   copy_video: bool = True,
+                   copy_audio: bool = True,
+                   map_existing_subs: bool = False) -> List[str]:
+        """Build the FFmpeg argv for embedding subtitles into one output"""
+        # -y: with stdin detached FFmpeg can't prompt before overwriting,
+        # and the sidecar cache already prevents pointless re-muxes
+        cmd = [self.ffmpeg, '-y']
+        cmd.extend(self._fast_mux_input_args())
+        cmd.extend(['-i', video_str])
+
+        # Add subtitle inputs
+        for track in subtitle_tracks:
+            cmd.extend(self._subtitle_input_args(track['file']))
+
+        cmd.extend(self._build_cmd_tail(subtitle_tracks, output_path,
+                                        video_suffix=video.suffix.lower(),
+                                        copy_video=copy_video,
+                                        copy_audio=copy_audio,
+                                        map_existing_subs=map_existing_subs))
+        return cmd
+
+    def _existing_subtitle_languages(self, video_str: str) -> set:
+        """Languages of subtitle tracks already present in the video"""
+        try:
+            st = os.stat(video_str)
+        except OSError:
+            return set()
+        streams = _probe_streams(video_str, st.st_mtime, st.st_size)
+        return {s.get('tags', {}).get('language')
+                for s in streams
+                if s.get('codec_type') == 'subtitle'} - {None}
+
+    def _fast_mux_input_args(self) -> List[str]:
+        """Input-side flags for --fast-mux (pre-generated PTS)"""
+        if self.fast_mux:
+            return ['-fflags', '+genpts']
+        return []
+
+    def _subtitle_input_args(self, track_file: str) -> List[str]:
+        """Input args for one subtitle file, hinting the demuxer when known"""
+        demuxer = self._SUBTITLE_DEMUXER_BY_SUFFIX.get(self._suffix(track_file))
+        if demuxer:
+            return ['-f', demuxer, '-i', track_file]
+        return ['-i', track_file]
+
+    def _build_cmd_tail(self,
+                        subtitle_tracks: List[Dict[str, str]],
+                        output_path: Path,
+                        video_suffix: str,
+                        copy_video: bool = True,
+                        copy_audio: bool = True,
+                        subtitle_input_offset: int = 1,
+                        map_existing_subs: bool = False) -> List[str]:
+        """Build the per-output part of the argv (maps, codecs, metadata, output)"""
+        cmd = []
+
+        # Map video stream
+        cmd.extend(['-map', '0:v'])
+
+        # Map audio streams (all of them)
+        cmd.extend(['-map', '0:a?'])
+
+        # Map subtitle streams
+        for i in range(len(subtitle_tracks)):
+            cmd.extend(['-map', f'{i + subtitle_input_offset}:s'])
+
+        # Carry over the input's own subtitle streams (mapped after the new
+        # tracks so -metadata:s:s:N below still addresses the new ones)
+        if map_existing_subs:
+            cmd.extend(['-map', '0:s?'])
+
+        # Video codec
+        if copy_video:
+            cmd.extend(['-c:v', 'copy'])
+        else:
+            cmd.extend(['-c:v', 'libx264', '-threads', str(self.threads)])
+
+        # Audio codec
+        if copy_audio:
+            cmd.extend(['-c:a', 'copy'])
+        else:
+            cmd.extend(['-c:a', 'aac'])
+
+        # Subtitle codec (mov_text for MP4, copy for MKV)
+        cmd.extend(['-c:s',
+                    self._SUBTITLE_CODEC_BY_CONTAINER.get(video_suffix, 'copy')])
+
+        # Add metadata for each subtitle track
+        for i, track in enumerate(subtitle_tracks):
+            lang = track.get('language', 'und')
+            title = track.get('title', '')
+
+            cmd.extend([f'-metadata:s:s:{i}', f'language={lang}'])
+            if title:
+                cmd.extend([f'-metadata:s:s:{i}', f'title={title}'])
+
+        # --fast-mux: shift timestamps to zero up front so the muxer skips
+        # its conditional rebuilding (av_rescale_q loops); off by default
+        # since it doesn't preserve timestamps bit-exactly
+        if self.fast_mux:
+            cmd.extend(['-avoid_negative_ts', 'make_zero'])
+
+        # MP4 outputs: +faststart moves the moov atom to the front (one
+        # extra pass at mux time, but streaming clients can start playback
+        # without scanning the whole file), and -map_metadata -1 skips
+        # copying useless per-stream tags — both nearly free under -c copy
+        if self._suffix(os.fspath(output_path)) == '.mp4':
+            cmd.extend(['-movflags', '+faststart', '-map_metadata', '-1'])
+
+        # Output file
+        cmd.append(str(output_path))
+
+        return cmd
+
+    @staticmethod
+    def _fingerprint_video(path: Path) -> str:
+        """Fast fingerprint: hash of first/last 1MB plus file size"""
+        size = path.stat().st_size
+        h = hashlib.sha256(str(size).encode())
+        with open(path, 'rb') as f:
+            h.update(f.read(1024 * 1024))
+            if size > 2 * 1024 * 1024:
+                f.seek(-1024 * 1024, os.SEEK_END)
+                h.update(f.read(1024 * 1024))
+        return h.hexdigest()[:16]
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """Full SHA-256 of a (small) file"""
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _embed_cache_key(self, video: Path,
+                         subtitle_tracks: List[Dict[str, str]],
+                         cmd: List[str]) -> Dict[str, str]:
+        """Hashes identifying this embed: inputs plus the exact command"""
+        input_hash = hashlib.sha256(
+            (self._fingerprint_video(video)
+             + ''.join(self._hash_file(t['file']) for t in subtitle_tracks)
+             ).encode()).hexdigest()
+        cmd_hash = hashlib.sha256('\0'.join(cmd).encode()).hexdigest()
+        return {'input_hash': input_hash, 'cmd_hash': cmd_hash}
+
+    def _run_ffmpeg(self, cmd: List[str]):
+        """
+        Run FFmpeg keeping only the tail of its stderr
+
+        stderr is drained continuously into a bounded ring buffer, so long
+        encodes hold tens of KB instead of the whole log and FFmpeg never
+        stalls on a full pipe. The stream stays bytes and is only decoded
+        on the error path, skipping a full decode pass over multi-MB logs.
+
+        Returns:
+            (returncode, list of the last stderr lines, decoded)
+        """
+        # close_fds=False keeps subprocess on the posix_spawn fast path:
+        # CPython <= 3.12 falls back to fork+exec whenever it has to close
+        # fds (3.13 can posix_spawn either way via closefrom). Nothing here
+        # opens inheritable fds that must be hidden from FFmpeg.
+        proc = subprocess.Popen(cmd,
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE,
+                                close_fds=False)
+
+        tail = deque(maxlen=200)
+
+        def drain():
+            for line in proc.stderr:
+                tail.append(line.rstrip(b'\n'))
+
+        drainer = threading.Thread(target=drain, daemon=True)
+        drainer.start()
+        proc.wait()
+        drainer.join()
+        proc.stderr.close()
+
+        if proc.returncode == 0:
+            return 0, []
+        return proc.returncode, [line.decode('utf-8', errors='replace')
+                                 for line in tail]
+
+    def embed_subtitles(self,
                        video_path: str,
                        subtitle_tracks: List[Dict[str, str]],
                        output_path: Optional[str] = None,
@@ -57,125 +313,238 @@ class SubtitleEmbedder:
                        copy_audio: bool = True) -> bool:
         """
         Embed multiple subtitle tracks into a video file
-        
+
         Args:
             video_path: Path to input video file
             subtitle_tracks: List of dicts with 'file', 'language', and optional 'title'
             output_path: Path for output file (default: adds '_subtitled' suffix)
             copy_video: Copy video stream without re-encoding (faster)
             copy_audio: Copy audio stream without re-encoding (faster)
-        
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Validate input video
-            video = self.validate_file(video_path, "video")
-            
-            # Validate subtitle files
-            for track in subtitle_tracks:
-                self.validate_file(track['file'], "subtitle")
-            
+            # Validate inputs; the stat syscalls are I/O-bound (slow on
+            # NFS/SMB mounts), so with many tracks they go through a thread
+            # pool. Serial for small track counts to skip the pool overhead.
+            if len(subtitle_tracks) <= 2:
+                video, video_str = self.validate_file(video_path, "video")
+                for track in subtitle_tracks:
+                    self.validate_file(track['file'], "subtitle")
+            else:
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    video_future = ex.submit(self.validate_file,
+                                             video_path, "video")
+                    list(ex.map(
+                        lambda t: self.validate_file(t['file'], "subtitle"),
+                        subtitle_tracks))
+                    video, video_str = video_future.result()
+
+            # Drop tracks whose language the video already carries; the
+            # existing streams are then mapped into the output so the
+            # language isn't lost. When nothing is left to add and no
+            # explicit output was requested, the whole remux is a no-op.
+            map_existing_subs = False
+            existing = self._existing_subtitle_languages(video_str)
+            if existing:
+                kept = [t for t in subtitle_tracks
+                        if t.get('language', 'und') == 'und'
+                        or t.get('language') not in existing]
+                skipped = len(subtitle_tracks) - len(kept)
+                if skipped:
+                    map_existing_subs = True
+                    print(f"⏭️  Skipping {skipped} track(s): "
+                          f"language already present in {video.name}")
+                    if not kept and output_path is None:
+                        return True
+                    subtitle_tracks = kept
+
             # Generate output path if not provided
             if output_path is None:
                 output_path = video.parent / f"{video.stem}_subtitled{video.suffix}"
             else:
                 output_path = Path(output_path)
-            
+
             # Build FFmpeg command
-            cmd = ['ffmpeg', '-i', str(video)]
-            
-            # Add subtitle inputs
-            for track in subtitle_tracks:
-                cmd.extend(['-i', track['file']])
-            
-            # Map video stream
-            cmd.extend(['-map', '0:v'])
-            
-            # Map audio streams (all of them)
-            cmd.extend(['-map', '0:a?'])
-            
-            # Map subtitle streams
-            for i in range(len(subtitle_tracks)):
-                cmd.extend(['-map', f'{i+1}:s'])
-            
-            # Video codec
-            if copy_video:
-                cmd.extend(['-c:v', 'copy'])
-            else:
-                cmd.extend(['-c:v', 'libx264'])
-            
-            # Audio codec
-            if copy_audio:
-                cmd.extend(['-c:a', 'copy'])
-            else:
-                cmd.extend(['-c:a', 'aac'])
-            
-            # Subtitle codec (mov_text for MP4, copy for MKV)
-            if video.suffix.lower() == '.mp4':
-                cmd.extend(['-c:s', 'mov_text'])
-            else:
-                cmd.extend(['-c:s', 'copy'])
-            
-            # Add metadata for each subtitle track
-            for i, track in enumerate(subtitle_tracks):
-                lang = track.get('language', 'und')
-                title = track.get('title', '')
-                
-                cmd.extend([f'-metadata:s:s:{i}', f'language={lang}'])
-                if title:
-                    cmd.extend([f'-metadata:s:s:{i}', f'title={title}'])
-            
-            # Output file
-            cmd.append(str(output_path))
-            
-            # Show command
-            print(f"\n🎬 Embedding subtitles into: {video.name}")
-            print(f"📝 Subtitle tracks: {len(subtitle_tracks)}")
+            cmd = self._build_cmd(video, video_str, subtitle_tracks, output_path,
+                                  copy_video=copy_video,
+                                  copy_audio=copy_audio,
+                                  map_existing_subs=map_existing_subs)
+
+            # Skip the mux entirely if inputs and command are unchanged
+            cache_path = output_path.with_suffix('.embed.json')
+            cache_key = self._embed_cache_key(video, subtitle_tracks, cmd)
+            if output_path.exists() and cache_path.exists():
+                try:
+                    cached = json.loads(cache_path.read_text())
+                except (ValueError, OSError):
+                    cached = {}
+                if (cached.get('input_hash') == cache_key['input_hash']
+                        and cached.get('cmd_hash') == cache_key['cmd_hash']):
+                    print(f"⏭️  Skipping {video.name}: {output_path.name} is up to date")
+                    return True
+
+            # Show command; emitted as one write so parallel workers don't
+            # interleave their progress line by line
+            lines = [f"\n🎬 Embedding subtitles into: {video.name}",
+                     f"📝 Subtitle tracks: {len(subtitle_tracks)}"]
             for i, track in enumerate(subtitle_tracks, 1):
                 lang = track.get('language', 'und')
-                title = track.get('title', Path(track['file']).stem)
-                print(f"   {i}. {title} [{lang}]")
-            print(f"💾 Output: {output_path.name}\n")
-            
-            # Execute FFmpeg
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True)
+                title = track.get('title',
+                                  os.path.splitext(os.path.basename(track['file']))[0])
+                lines.append(f"   {i}. {title} [{lang}]")
+            lines.append(f"💾 Output: {output_path.name}\n")
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             
-            if result.returncode == 0:
-                print(f"✅ Success! Subtitles embedded successfully.")
-                print(f"📁 Output saved to: {output_path}")
+            # Execute FFmpeg (stdin detached so parallel instances
+            # don't fight over the TTY)
+            returncode, stderr_tail = self._run_ffmpeg(cmd)
+
+            if returncode == 0:
+                cache_key['output_mtime'] = os.path.getmtime(output_path)
+                cache_path.write_text(json.dumps(cache_key))
+                sys.stdout.write(f"✅ Success! Subtitles embedded successfully.\n"
+                                 f"📁 Output saved to: {output_path}\n")
+                sys.stdout.flush()
                 return True
             else:
-                print(f"❌ Error during embedding:")
-                print(result.stderr)
+                sys.stdout.write("❌ Error during embedding:\n"
+                                 + '\n'.join(stderr_tail) + '\n')
+                sys.stdout.flush()
                 return False
                 
         except Exception as e:
             print(f"❌ Error: {str(e)}")
             return False
 
+    def embed_subtitles_batch(self, jobs: List[Dict]) -> bool:
+        """
+        Embed subtitles for multiple jobs, batching FFmpeg invocations
+
+        Jobs sharing the same input video with MKV outputs are merged into a
+        single multi-output FFmpeg command, so the video is demuxed once and
+        only one process is spawned for the whole group. MP4 outputs fall back
+        to one FFmpeg call per job (mov_text with multiple outputs is fragile).
+
+        Args:
+            jobs: List of dicts with the same keys as embed_subtitles()
+                  ('video_path', 'subtitle_tracks', optional 'output_path',
+                  'copy_video', 'copy_audio')
+
+        Returns:
+            True if all jobs succeeded, False otherwise
+        """
+        # Group batchable MKV jobs by input video; everything else runs solo
+        groups: Dict[str, List[Dict]] = {}
+        solo_jobs = []
+
+        for job in jobs:
+            output = job.get('output_path')
+            if output is None:
+                video = Path(job['video_path'])
+                output = video.parent / f"{video.stem}_subtitled{video.suffix}"
+            if Path(output).suffix.lower() == '.mkv':
+                groups.setdefault(job['video_path'], []).append(job)
+            else:
+                solo_jobs.append(job)
+
+        all_ok = True
+
+        for video_path, group in groups.items():
+            if len(group) == 1:
+                solo_jobs.append(group[0])
+                continue
+            all_ok &= self._run_batch_group(video_path, group)
+
+        for job in solo_jobs:
+            all_ok &= self.embed_subtitles(
+                video_path=job['video_path'],
+                subtitle_tracks=job['subtitle_tracks'],
+                output_path=job.get('output_path'),
+                copy_video=job.get('copy_video', True),
+                copy_audio=job.get('copy_audio', True)
+            )
+
+        return all_ok
+
+    def _run_batch_group(self, video_path: str, group: List[Dict]) -> bool:
+        """Run one multi-output FFmpeg command for jobs sharing a video input"""
+        try:
+            video, video_str = self.validate_file(video_path, "video")
+
+            for job in group:
+                for track in job['subtitle_tracks']:
+                    self.validate_file(track['file'], "subtitle")
+
+            # Single shared video input, then every job's subtitle inputs
+            cmd = [self.ffmpeg, '-y']
+            cmd.extend(self._fast_mux_input_args())
+            cmd.extend(['-i', video_str])
+            input_offsets = []
+            next_input = 1
+
+            for job in group:
+                input_offsets.append(next_input)
+                for track in job['subtitle_tracks']:
+                    cmd.extend(self._subtitle_input_args(track['file']))
+                    next_input += 1
+
+            # One output section per job
+            for job, offset in zip(group, input_offsets):
+                output = job.get('output_path')
+                if output is None:
+                    output = video.parent / f"{video.stem}_subtitled{video.suffix}"
+                cmd.extend(self._build_cmd_tail(
+                    job['subtitle_tracks'], Path(output),
+                    video_suffix=video.suffix.lower(),
+                    copy_video=job.get('copy_video', True),
+                    copy_audio=job.get('copy_audio', True),
+                    subtitle_input_offset=offset
+                ))
+
+            print(f"\n🎬 Batch embedding into: {video.name} ({len(group)} outputs)")
+
+            # close_fds=False for the posix_spawn fast path (see _run_ffmpeg)
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                    stdin=subprocess.DEVNULL,
+                                    close_fds=False)
+            proc.wait()
+
+            if proc.returncode == 0:
+                print(f"✅ Success! {len(group)} outputs written.")
+                return True
+            else:
+                print(f"❌ Error during batch embedding (exit code {proc.returncode})")
+                return False
+
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+            return False
+
+# file[:lang[:title]] — the file part may start with a Windows drive letter
+# (C:\...), and the title may itself contain colons
+_SUBTITLE_ARG_RE = re.compile(
+    r'^([A-Za-z]:[^:]+|[^:]+)(?::([^:]*))?(?::(.*))?$')
+
 def parse_subtitle_arg(arg: str) -> Dict[str, str]:
     """
     Parse subtitle argument in format: file.srt:eng:English
     or file.srt:eng
     or just file.srt
     """
-    parts = arg.split(':')
-    result = {'file': parts[0]}
-    
-    if len(parts) > 1:
-        result['language'] = parts[1]
-    else:
-        result['language'] = 'und'  # undefined
-    
-    if len(parts) > 2:
-        result['title'] = ':'.join(parts[2:])  # Join back in case title has colons
-    else:
-        result['title'] = Path(parts[0]).stem
-    
-    return result
+    m = _SUBTITLE_ARG_RE.match(arg)
+    if m is None:
+        # Degenerate input (e.g. empty string): treat it all as the file part
+        return {'file': arg, 'language': 'und', 'title': Path(arg).stem}
+
+    file, language, title = m.group(1, 2, 3)
+    return {
+        'file': file,
+        'language': language if language else 'und',  # und = undefined
+        'title': title if title else Path(file).stem,
+    }
 
 def main():
     parser = argparse.ArgumentParser(
@@ -195,6 +564,12 @@ Examples:
   # Re-encode video (slower but more compatible)
   python subtitle_embedder.py video.mp4 sub.srt:eng --no-copy-video
 
+  # Multiple videos in parallel (same subtitles embedded into each)
+  python subtitle_embedder.py ep1.mkv ep2.mkv ep3.mkv sub.srt:eng --jobs 4
+
+  # Videos listed in a file, one path per line
+  python subtitle_embedder.py --input-list videos.txt sub.srt:eng
+
 Language codes (ISO 639-2):
   eng - English    spa - Spanish    fra - French
   deu - German     ita - Italian    por - Portuguese
@@ -203,12 +578,23 @@ Language codes (ISO 639-2):
         '''
     )
     
-    parser.add_argument('video', help='Input video file (MP4, MKV, AVI, MOV)')
+    parser.add_argument('video',
+                       nargs='*',
+                       default=[],
+                       help='Input video file(s) (MP4, MKV, AVI, MOV); '
+                            'optional when --input-list is given')
     parser.add_argument('subtitles',
                        nargs='+',
                        help='Subtitle files in format: file.srt:lang:title (space-separated)')
     parser.add_argument('-o', '--output',
-                       help='Output video file (default: input_subtitled.ext)')
+                       help='Output video file (default: input_subtitled.ext; single video only)')
+    parser.add_argument('--input-list',
+                       help='Text file listing additional input videos, one per line')
+    parser.add_argument('-j', '--jobs',
+                       type=int,
+                       default=max(1, (os.cpu_count() or 2) // 2),
+                       help='Number of parallel FFmpeg jobs for multiple videos '
+                            '(default: cores/2, a good fit for I/O-bound stream copies)')
     parser.add_argument('--no-copy-video',
                        action='store_false',
                        dest='copy_video',
@@ -217,22 +603,72 @@ Language codes (ISO 639-2):
                        action='store_false',
                        dest='copy_audio',
                        help='Re-encode audio instead of copying')
+    parser.add_argument('--fast-mux',
+                       action='store_true',
+                       help='Pre-generate PTS and zero-shift timestamps '
+                            '(-fflags +genpts, -avoid_negative_ts make_zero) so '
+                            'FFmpeg skips timestamp rebuilding; timestamps are '
+                            'no longer preserved bit-exactly')
+    parser.add_argument('--threads',
+                       type=int,
+                       default=0,
+                       help='Encoder threads per FFmpeg process when re-encoding '
+                            '(default: 0 = auto). For parallel re-encodes, cores/2 '
+                            'threads across 2 processes tends to be the sweet spot.')
     
     args = parser.parse_args()
-    
+
+    # Two greedy positionals can't be split by argparse, so re-partition
+    # the combined list by extension (subtitle args carry :lang:title tails)
+    videos = []
+    subtitle_args = []
+    for arg in args.video + args.subtitles:
+        if Path(arg).suffix.lower() in SubtitleEmbedder.SUPPORTED_VIDEO_FORMATS:
+            videos.append(arg)
+        else:
+            subtitle_args.append(arg)
+
+    if args.input_list:
+        with open(args.input_list) as f:
+            videos.extend(line.strip() for line in f if line.strip())
+
+    if not videos:
+        parser.error('no input video given')
+    if not subtitle_args:
+        parser.error('no subtitle files given')
+    if args.output and len(videos) > 1:
+        parser.error('-o/--output only makes sense with a single input video')
+
     # Parse subtitle arguments
-    subtitle_tracks = [parse_subtitle_arg(s) for s in args.subtitles]
-    
+    subtitle_tracks = [parse_subtitle_arg(s) for s in subtitle_args]
+
     # Create embedder and process
-    embedder = SubtitleEmbedder()
-    success = embedder.embed_subtitles(
-        video_path=args.video,
-        subtitle_tracks=subtitle_tracks,
-        output_path=args.output,
-        copy_video=args.copy_video,
-        copy_audio=args.copy_audio
-    )
-    
+    embedder = SubtitleEmbedder(threads=args.threads, fast_mux=args.fast_mux)
+
+    if len(videos) == 1:
+        success = embedder.embed_subtitles(
+            video_path=videos[0],
+            subtitle_tracks=subtitle_tracks,
+            output_path=args.output,
+            copy_video=args.copy_video,
+            copy_audio=args.copy_audio
+        )
+    else:
+        # Stream copies are I/O-bound, so cores/2 workers keep
+        # the disk busy without oversubscribing the CPU
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [
+                executor.submit(embedder.embed_subtitles,
+                                video_path=video,
+                                subtitle_tracks=subtitle_tracks,
+                                copy_video=args.copy_video,
+                                copy_audio=args.copy_audio)
+                for video in videos
+            ]
+            results = [f.result() for f in futures]
+        success = all(results)
+        print(f"\n📊 {sum(results)}/{len(results)} videos processed successfully")
+
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':